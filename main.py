@@ -4,7 +4,6 @@
 # dependencies = [
 #     "beartype",
 #     "tomli",
-#     "tomli-w",
 #     "tyro",
 # ]
 # ///
@@ -19,32 +18,71 @@ Examples:
 10k progress pullups
 10k progress meditation
 
+printf 'pullups,5\nmeditation,30\n' | 10k batch
+
 """
 
-import contextlib
 import dataclasses
+import datetime
 import fcntl
+import functools
+import io
+import json
+import os
 import pathlib
-import csv
-import datetime
+import struct
 import sys
-import tomli
-import tomli_w
-import difflib
+import time
 
-import beartype
-import tyro
+# Heavier modules (tomli, heapq, mmap, argparse, tyro, beartype) are imported where
+# they are used so that each command only pays for what it needs at startup.
 
 scriptname = "tenthousand"
 
-default_config_path = pathlib.Path.home() / f".config/{scriptname}/config.toml"
+# Runtime type checking of the CLI entry points is on by default; TENKAY_FAST (or
+# TENKAY_NO_BEARTYPE=1) skips it. Internal classes and helpers are never wrapped, since
+# they only receive values the entry points have already checked.
+typecheck_enabled = not (
+    os.environ.get("TENKAY_FAST") or os.environ.get("TENKAY_NO_BEARTYPE") == "1"
+)
+
+
+def _typecheck(fn):
+    """Wrap <fn> with beartype unless runtime type checking is disabled."""
+    if not typecheck_enabled:
+        return fn
+
+    try:
+        import beartype
+    except ImportError:
+        # beartype is a development aid; run unchecked without it.
+        return fn
+
+    return beartype.beartype(fn)
+
+
+# Resolve the home directory once, from $HOME when set, rather than per Path.home() call.
+_home = os.environ.get("HOME") or pathlib.Path.home().as_posix()
+default_config_path = pathlib.Path(f"{_home}/.config/{scriptname}/config.toml")
+default_root = pathlib.Path(f"{_home}/.local/state/{scriptname}")
 
+# The default root is fixed, so its TOML line is built once here rather than serialized
+# with dataclasses.asdict + tomli_w on first run.
+_escaped_root = str(default_root).replace("\\", "\\\\").replace('"', '\\"')
+default_root_toml = f'root = "{_escaped_root}"\n'.encode()
 
-@beartype.beartype
-@dataclasses.dataclass(frozen=True)
+
+def _current_year() -> int:
+    """The current local calendar year."""
+    return time.localtime().tm_year
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Config:
-    root: pathlib.Path = pathlib.Path.home() / f".local/state/{scriptname}"
-    year: int = datetime.datetime.now().year
+    root: pathlib.Path = default_root
+    # Evaluated per instance rather than once at import, so a process started just
+    # before midnight on December 31st still picks up the new year.
+    year: int = dataclasses.field(default_factory=_current_year)
 
     @property
     def taskstore(self) -> pathlib.Path:
@@ -53,29 +91,79 @@ class Config:
 
     @classmethod
     def from_path(cls, path: pathlib.Path):
+        """Load the config at <path>, creating the default config if needed."""
         try:
-            with open(path, "rb") as f:
-                config_dict = tomli.load(f)
-                # Convert string path back to Path object
-                config_dict["root"] = pathlib.Path(config_dict["root"])
-                return cls(**config_dict)
+            st = os.stat(path)
         except FileNotFoundError:
             if path == default_config_path:
                 print(f"Creating new config file at {path}")
                 path.parent.mkdir(parents=True, exist_ok=True)
                 cfg = cls()
-                config_dict = dataclasses.asdict(cfg)
-                # Convert Path objects to strings for TOML serialization
-                config_dict["root"] = str(config_dict["root"])
-                with open(path, "wb") as f:
-                    tomli_w.dump(config_dict, f)
+                # Write to a temporary file and rename it into place so an interrupted
+                # first run can't leave a truncated config behind. The name is per
+                # process so concurrent first runs don't rename each other's file.
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(default_root_toml + f"year = {cfg.year}\n".encode())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
                 return cfg
             else:
                 print(f"Error: Config file not found at {path}", file=sys.stderr)
                 sys.exit(1)
 
+        return _load_config_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: pathlib.Path, mtime_ns: int, size: int) -> Config:
+    """Parse the config at <path>, memoized per (path, mtime, size) within this process.
+
+    Across processes, the parsed TOML is cached as JSON in a sidecar <path>.cache keyed by the TOML file's mtime and size.
+    The cache holds the plain parsed dict rather than a Config, so it stays valid if the Config class changes shape.
+    """
+    key = [mtime_ns, size]
+    cache_path = path.with_suffix(path.suffix + ".cache")
+    config_dict = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        # Missing or corrupt cache; fall back to parsing the TOML.
+        cached = None
+    # Anything but a [key, dict] pair written by us (e.g. a truncated or hand-edited
+    # file that is still valid JSON) is treated as a miss too.
+    if (
+        isinstance(cached, list)
+        and len(cached) == 2
+        and cached[0] == key
+        and isinstance(cached[1], dict)
+    ):
+        config_dict = cached[1]
+
+    if config_dict is None:
+        import tomli
+
+        with open(path, "rb") as f:
+            config_dict = tomli.load(f)
+
+        # A per-process temporary name, so concurrent misses can't rename each other's
+        # half-written file into place.
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump([key, config_dict], f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The cache is only an optimization (the directory may be read-only).
+            pass
+
+    # Convert string path back to Path object
+    config_dict["root"] = pathlib.Path(config_dict["root"])
+    return Config(**config_dict)
+
 
-@beartype.beartype
 class TaskNotFoundError(Exception):
     """Raised when attempting to load a task that doesn't exist"""
 
@@ -85,19 +173,39 @@ class TaskNotFoundError(Exception):
         super().__init__(f"Task '{task}' not found")
 
 
-@beartype.beartype
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Task:
     name: str
-    data: list[tuple[datetime.datetime, int]]
+    total: int
+    # Raw "<timestamp>,<count>" rows (without the header), only kept when requested.
+    _raw: list[bytes] | None = dataclasses.field(default=None, repr=False)
+    _parsed: list[tuple[datetime.datetime, int]] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def parsed_data(self) -> list[tuple[datetime.datetime, int]]:
+        """The (timestamp, count) rows, parsed on first access and then cached.
+
+        Raises:
+            ValueError: If the task was loaded without raw=True
+        """
+        if self._parsed is None:
+            if self._raw is None:
+                raise ValueError(f"Task '{self.name}' was loaded without raw=True")
+            self._parsed = _parse_rows(self._raw)
+        return self._parsed
 
     @classmethod
-    def load(cls, cfg: Config, name: str) -> "Task":
+    def load(cls, cfg: Config, name: str, raw: bool = False) -> "Task":
         """Load an existing task from disk.
 
+        Only the total is computed; timestamps are never parsed.
+
         Arguments:
             cfg: The configuration object
             name: Name of the task to load
+            raw: Whether to also keep the raw rows, for per-row analysis via parsed_data
 
         Returns:
             The loaded Task
@@ -107,22 +215,104 @@ class Task:
         """
         task_file = cfg.taskstore / f"{name}.csv"
 
-        if not task_file.exists():
-            # Get list of similar tasks for the error message
-            existing_tasks = [f.stem for f in cfg.taskstore.glob("*.csv")]
-            matches = difflib.get_close_matches(name, existing_tasks, n=3, cutoff=0.6)
-            raise TaskNotFoundError(name, matches)
+        try:
+            st = os.stat(task_file)
+        except FileNotFoundError:
+            raise cls._not_found(cfg, name) from None
+
+        if not raw:
+            # Fast path: start from the running total kept up to date by appends.
+            cached = _read_total(task_file, st)
+            if cached is not None:
+                total, offset, tail = cached
+                if offset == st.st_size:
+                    return cls(name, total)
+
+                # Rows were appended without advancing the total (e.g. concurrent adds),
+                # so only those rows need summing.
+                appended = _read_after(task_file, offset, st.st_size, tail)
+                if appended is not None:
+                    total += _sum_counts(appended)
+                    tail = (tail + appended)[-_tail_size:]
+                    try:
+                        _write_total(task_file, total, st.st_size, st.st_ino, tail)
+                    except OSError:
+                        # The total is only an optimization (the taskstore may be
+                        # read-only).
+                        pass
+                    return cls(name, total)
+
+            return cls(name, cls.sum_counts(cfg, name))
+
+        rows = _load_rows_cached(task_file, st.st_mtime_ns, st.st_size)
+        total = _sum_counts(b"\n".join(rows))
+
+        with open(task_file, "rb") as f:
+            tail = _read_tail(f.fileno(), st.st_size)
+        try:
+            _write_total(task_file, total, st.st_size, st.st_ino, tail)
+        except OSError:
+            # The total is only an optimization (the taskstore may be read-only).
+            pass
+        # Copy the memoized rows so callers can't mutate the cache.
+        return cls(name, total, list(rows))
+
+    @classmethod
+    def sum_counts(cls, cfg: Config, name: str) -> int:
+        """Sum the counts of an existing task from its whole CSV, and refresh its cached total.
 
-        data = []
-        with open(task_file, "r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                data.append((
-                    datetime.datetime.fromisoformat(row["timestamp"]),
-                    int(row["count"]),
-                ))
+        Unlike load, this ignores the cached total and never materializes the rows: small files are summed in one read(), larger ones through mmap one window at a time.
+
+        Arguments:
+            cfg: The configuration object
+            name: Name of the task to sum
 
-        return cls(name, data)
+        Returns:
+            The total count recorded for the task
+
+        Raises:
+            TaskNotFoundError: If the task doesn't exist
+        """
+        task_file = cfg.taskstore / f"{name}.csv"
+
+        try:
+            f = open(task_file, "rb")
+        except FileNotFoundError:
+            raise cls._not_found(cfg, name) from None
+
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_size <= mmap_window:
+                f.readline()  # Header
+                total = _sum_counts(f.read())
+                offset = f.tell()
+            else:
+                total, offset = _sum_counts_mmap(f)
+            tail = _read_tail(f.fileno(), offset)
+
+        try:
+            _write_total(task_file, total, offset, st.st_ino, tail)
+        except OSError:
+            # The total is only an optimization (the taskstore may be read-only).
+            pass
+        return total
+
+    @staticmethod
+    def _not_found(cfg: Config, name: str) -> TaskNotFoundError:
+        """Build the error for a missing task, including similarly named tasks."""
+        # Get list of similar tasks for the error message. scandir avoids building a
+        # Path (and running fnmatch) per directory entry, unlike glob.
+        try:
+            with os.scandir(cfg.taskstore) as entries:
+                existing_tasks = [
+                    entry.name[:-4]
+                    for entry in entries
+                    if entry.name.endswith(".csv") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            existing_tasks = []
+        matches = _fuzzy_closest(name, existing_tasks, n=3, max_dist=2)
+        return TaskNotFoundError(name, matches)
 
     @staticmethod
     def exists(cfg: Config, name: str) -> bool:
@@ -138,39 +328,73 @@ class Task:
         task_file = cfg.taskstore / f"{name}.csv"
         return task_file.exists()
 
-    @classmethod
-    def new(cls, cfg: Config, name: str) -> "Task":
-        """Create a new task file on disk or return existing task.
+    @staticmethod
+    def append(cfg: Config, name: str, count: int):
+        """Append a row to a task, creating the task file (with its header) if needed.
 
         Arguments:
             cfg: The configuration object
-            name: Name of the task to create
-
-        Returns:
-            A Task instance - either new with empty data or existing task
+            name: Name of the task to append to
+            count: Number of actions completed
         """
-        if cls.exists(cfg, name):
-            return cls.load(cfg, name)
-
         task_file = cfg.taskstore / f"{name}.csv"
-        task_file.parent.mkdir(parents=True, exist_ok=True)
+        # ISO timestamps and ints never need CSV quoting, so format the row directly.
+        row = f"{_utc_timestamp()},{count}\n".encode()
 
-        with locked(task_file, "w") as fd:
-            writer = csv.writer(fd)
-            writer.writerow(["timestamp", "count"])
+        fd = _open_for_append(task_file)
+        try:
+            # A single write() to an O_APPEND descriptor is atomic for a row this small,
+            # so concurrent appenders don't need a lock.
+            os.write(fd, row)
+            # With O_APPEND, the offset now points just past the row we wrote.
+            end = os.lseek(fd, 0, os.SEEK_CUR)
+            ino = os.fstat(fd).st_ino
+        finally:
+            os.close(fd)
 
-        return cls(name, [])
+        _bump_total(task_file, ino, end - len(row), end, count, row[-_tail_size:])
 
-    def add(self, cfg: Config, count: int):
-        """ """
-        task_file = cfg.taskstore / f"{self.name}.csv"
-        with locked(task_file, "a") as fd:
-            writer = csv.writer(fd)
-            timestamp = datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
-            writer.writerow([timestamp, count])
+    @staticmethod
+    def extend(cfg: Config, name: str, counts: list[int]):
+        """Append one row per count to a task under a single lock, with one writev() per IOV_MAX rows.
+
+        Arguments:
+            cfg: The configuration object
+            name: Name of the task to append to
+            counts: Number of actions completed, one entry per row
+        """
+        task_file = cfg.taskstore / f"{name}.csv"
+        rows = [f"{_utc_timestamp()},{count}\n".encode() for count in counts]
+        size = sum(map(len, rows))
+        # -1 means the limit is indeterminate; POSIX guarantees at least 16.
+        iov_max = os.sysconf("SC_IOV_MAX")
+        if iov_max <= 0:
+            iov_max = 16
+
+        fd = _open_for_append(task_file)
+        try:
+            # Many rows may exceed the size for which O_APPEND writes are atomic, so hold
+            # the lock while writing them.
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            for i in range(0, len(rows), iov_max):
+                chunk = rows[i : i + iov_max]
+                written = os.writev(fd, chunk)
+                if written < sum(map(len, chunk)):
+                    # A short write (e.g. the disk filling up). Finish the chunk with
+                    # write(), which raises OSError once nothing more can be written.
+                    rest = memoryview(b"".join(chunk))[written:]
+                    while rest:
+                        rest = rest[os.write(fd, rest) :]
+            end = os.lseek(fd, 0, os.SEEK_CUR)
+            ino = os.fstat(fd).st_ino
+        finally:
+            os.close(fd)  # Also releases the lock.
 
+        tail = rows[-1][-_tail_size:]
+        _bump_total(task_file, ino, end - size, end, sum(counts), tail)
 
-@beartype.beartype
+
+@_typecheck
 def add(
     count: int,
     task: str,
@@ -189,17 +413,16 @@ def add(
     """
     cfg = Config.from_path(config)
 
-    if not Task.exists(cfg, task) and not init_task:
+    if not init_task and not Task.exists(cfg, task):
         response = input(f"Task '{task}' doesn't exist. Create it? [y/N] ").lower()
         if response != "y":
             print("Aborted.", file=sys.stderr)
             sys.exit(1)
-    task_obj = Task.new(cfg, task)
 
-    task_obj.add(cfg, count)
+    Task.append(cfg, task, count)
 
 
-@beartype.beartype
+@_typecheck
 def progress(task: str, /, config: pathlib.Path = default_config_path):
     """
     Displays progress towards 10K.
@@ -213,7 +436,7 @@ def progress(task: str, /, config: pathlib.Path = default_config_path):
     cfg = Config.from_path(config)
 
     try:
-        task_obj = Task.load(cfg, task)
+        total = Task.load(cfg, task).total
     except TaskNotFoundError as e:
         print(f"Error: Task '{e.task}' not found", file=sys.stderr)
         if e.matches:
@@ -222,17 +445,14 @@ def progress(task: str, /, config: pathlib.Path = default_config_path):
                 print(f"  {match}", file=sys.stderr)
         sys.exit(1)
 
-    # Calculate total completed
-    total = sum(count for _, count in task_obj.data)
-
     # Calculate progress metrics
-    now = datetime.datetime.now(tz=datetime.timezone.utc)
-    year_start = datetime.datetime(now.year, 1, 1, tzinfo=datetime.timezone.utc)
-    year_end = datetime.datetime(now.year, 12, 31, tzinfo=datetime.timezone.utc)
+    now = time.gmtime()
+    year = now.tm_year
+    is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
-    days_elapsed = (now - year_start).days
-    days_remaining = (year_end - now).days + 1  # Include today
-    days_in_year = (year_end - year_start).days + 1
+    days_elapsed = now.tm_yday - 1  # Full days since January 1st (UTC)
+    days_in_year = 366 if is_leap else 365
+    days_remaining = days_in_year - days_elapsed  # Include today
 
     expected = int((days_elapsed / days_in_year) * 10000)
     daily_needed = (
@@ -252,37 +472,435 @@ def progress(task: str, /, config: pathlib.Path = default_config_path):
     )
 
 
-@contextlib.contextmanager
-@beartype.beartype
-def locked(filepath: pathlib.Path, mode: str = "w"):
-    """Context manager for file locking.
+@functools.lru_cache(maxsize=8)
+def _load_rows_cached(
+    task_file: pathlib.Path, mtime_ns: int, size: int
+) -> tuple[bytes, ...]:
+    """Read the raw rows of <task_file>, memoized per (path, mtime, size) within this process.
+
+    Only the first <size> bytes are read, so rows appended since the stat are ignored and the result always matches the key.
+    """
+    with open(task_file, "rb") as f:
+        # Task files we create start with exactly task_header, so skip it by length.
+        if f.read(len(task_header)) != task_header:
+            # Older files (written with csv.writer) end the header with \r\n instead.
+            f.seek(0)
+            f.readline()
+        data = f.read(max(size - f.tell(), 0))
+
+    # Skip the empty string after the trailing newline.
+    return tuple(line for line in data.split(b"\n") if line)
+
+
+def _read_after(
+    task_file: pathlib.Path, offset: int, size: int, tail: bytes
+) -> bytes | None:
+    """Read the rows in bytes [offset, size) of <task_file>.
+
+    Returns None if the bytes just before <offset> are no longer <tail> (the CSV was edited since the total was written), in which case the whole file needs rescanning.
+    """
+    if offset <= 0 or not tail.endswith(b"\n"):
+        return None
+
+    with open(task_file, "rb") as f:
+        # Read the bytes before <offset> too; they must still end with the same row.
+        f.seek(offset - len(tail))
+        data = f.read(size - offset + len(tail))
+
+    if data[: len(tail)] != tail:
+        return None
+    return data[len(tail) :]
+
+
+def _sum_counts(data: bytes) -> int:
+    """Sum the counts of newline-separated raw "<timestamp>,<count>" rows."""
+    # We write the rows ourselves, so each has exactly one comma. Turning newlines into
+    # commas then alternates timestamps and counts, and the split, int() conversions and
+    # sum all run in C rather than as one Python-level iteration per row.
+    try:
+        return sum(map(int, data.replace(b"\n", b",").split(b",")[1::2]))
+    except ValueError:
+        # Rows we didn't write (e.g. blank lines from hand edits) break the alternation.
+        pass
+
+    total = 0
+    for row in data.split(b"\n"):
+        if row.strip():
+            total += int(row[row.rfind(b",") + 1 :])
+    return total
+
+
+def _parse_rows(rows: list[bytes]) -> list[tuple[datetime.datetime, int]]:
+    """Parse raw "<timestamp>,<count>" rows into (timestamp, count) pairs."""
+    # As in _sum_counts, one comma per row means the fields alternate, so decoding,
+    # fromisoformat and int() can each run over every row in one C-level pass.
+    # (datetime.fromisoformat is implemented in C, and beats slicing the fixed-format
+    # fields out by hand.)
+    fields = b"\n".join(rows).decode().replace("\n", ",").split(",")
+    try:
+        return list(
+            zip(
+                map(datetime.datetime.fromisoformat, fields[0::2]),
+                map(int, fields[1::2]),
+                strict=True,
+            )
+        )
+    except ValueError:
+        # Rows we didn't write (e.g. with extra commas) break the alternation.
+        pass
+
+    parsed = []
+    for row in rows:
+        timestamp, _, count = row.rpartition(b",")
+        parsed.append((datetime.datetime.fromisoformat(timestamp.decode()), int(count)))
+    return parsed
+
+
+def _sum_counts_mmap(f: io.BufferedReader) -> tuple[int, int]:
+    """Sum the counts of an open task file through mmap, one window of rows at a time.
+
+    This skips BufferedReader's copy and never holds more than one window of rows as bytes.
+
+    Returns:
+        The total and the number of bytes it covers.
+    """
+    import mmap
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        total = 0
+        start = mm.find(b"\n") + 1  # Skip the header
+        while start < len(mm):
+            # End the window after its last complete row (or take the rest of the file).
+            end = mm.rfind(b"\n", start, start + mmap_window) + 1 or len(mm)
+            total += _sum_counts(mm[start:end])
+            start = end
+        return total, len(mm)
+
+
+def _open_for_append(task_file: pathlib.Path) -> int:
+    """Open <task_file> with O_APPEND, creating it (with its header) if needed.
+
+    One open() both creates the file if needed and returns the fd to write to; a single fstat() then tells us whether it still needs its header.
+
+    Arguments:
+        task_file: the task CSV.
+    """
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    try:
+        fd = os.open(task_file, flags, 0o644)
+    except FileNotFoundError:
+        task_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(task_file, flags, 0o644)
+
+    try:
+        if os.fstat(fd).st_size == 0:
+            _write_header(fd, task_file)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _write_header(fd: int, task_file: pathlib.Path):
+    """Write the CSV header through <fd> unless another process already has.
+
+    Arguments:
+        fd: an O_APPEND descriptor for <task_file>.
+        task_file: the task CSV.
+    """
+    # Lock the descriptor we already have rather than reopening the file. Another
+    # process may have created the file and written the header since our fstat.
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        st = os.fstat(fd)
+        if st.st_size == 0:
+            os.write(fd, task_header)
+            _write_total(task_file, 0, len(task_header), st.st_ino, task_header)
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _fuzzy_closest(
+    name: str, candidates: list[str], n: int = 3, max_dist: int = 2
+) -> list[str]:
+    """Return up to <n> candidates closest to <name>, nearest first.
+
+    Distance is the optimal string alignment (restricted Damerau-Levenshtein) distance, so a swap of two adjacent characters counts as one edit.
+    Candidates further than <max_dist> edits away are dropped; for short names the limit is lowered to half the name's length so that unrelated short names don't match.
+    """
+    import heapq
+
+    max_dist = min(max_dist, len(name) // 2)
+    scored = []
+    for candidate in candidates:
+        dist = _bounded_edit_distance(name, candidate, max_dist)
+        if dist is not None:
+            scored.append((dist, candidate))
+    return [candidate for _, candidate in heapq.nsmallest(n, scored)]
+
+
+def _bounded_edit_distance(a: str, b: str, max_dist: int) -> int | None:
+    """Optimal string alignment distance between <a> and <b>, or None if it exceeds <max_dist>."""
+    # The distance is at least the difference in lengths, so skip hopeless candidates.
+    if abs(len(a) - len(b)) > max_dist:
+        return None
+
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        # Every later row's minimum is at least this row's minimum, so stop early.
+        if min(cur) > max_dist:
+            return None
+        prev2, prev = prev, cur
+
+    return prev[-1] if prev[-1] <= max_dist else None
+
+
+def _utc_timestamp() -> str:
+    """Current time as an ISO 8601 UTC string, e.g. 2024-01-31T12:00:00.000000+00:00.
+
+    Equivalent to datetime.datetime.now(tz=datetime.timezone.utc).isoformat() without building a datetime, except that the microseconds are always present.
+    """
+    secs, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        + f".{nanos // 1000:06d}+00:00"
+    )
+
+
+# Every task file starts with this fixed 16-byte header.
+task_header = b"timestamp,count\n"
 
-    Creates an exclusive lock on <filepath>.lock while allowing concurrent reads of state_file.
 
-    Usage:
-        with locked(filepath) as fd:
-            # Write to fd...
+# Task files larger than this are summed through mmap, in windows of this size.
+mmap_window = 64 * 1024
+
+
+# <task>.total holds the running total of <task>.csv and the CSV byte offset it covers,
+# plus the CSV's inode and the (up to) _tail_size bytes before that offset. The last two
+# let us notice a CSV that was replaced or edited before catching up on appended rows.
+_tail_size = 32
+_total_format = struct.Struct(f"<qQQ{_tail_size}s")
+
+
+def _read_tail(fd: int, offset: int) -> bytes:
+    """Read the (up to) _tail_size bytes before <offset> of the file open as <fd>."""
+    n = min(offset, _tail_size)
+    return os.pread(fd, n, offset - n)
+
+
+def _read_total(
+    task_file: pathlib.Path, st: os.stat_result
+) -> tuple[int, int, bytes] | None:
+    """Return the cached (total, offset, tail) for <task_file>, or None if it is missing or stale.
+
+    The offset may be less than the CSV's size if rows were appended without advancing the total; those rows still need to be summed, after checking that the bytes before the offset are still <tail>.
 
     Arguments:
-        filepath: the file that you want to write to in a locked fashion.
-        mode: the mode to open filepath in.
+        task_file: the task CSV.
+        st: a stat of <task_file>.
     """
-    lock_file = filepath.with_suffix(filepath.suffix + ".lock")
-    lock_file.touch(exist_ok=True)
+    try:
+        fd = os.open(task_file.with_suffix(".total"), os.O_RDONLY)
+    except FileNotFoundError:
+        return None
 
-    with open(lock_file, "r+") as lock_fd:
-        fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        buf = os.pread(fd, _total_format.size, 0)
+        total_mtime_ns = os.fstat(fd).st_mtime_ns
+    finally:
+        os.close(fd)
+
+    if len(buf) != _total_format.size:
+        return None
+    total, offset, ino, tail = _total_format.unpack(buf)
+    # The CSV was replaced (e.g. saved as a new file by an editor), shrank, or was
+    # modified in place after the total was written.
+    if ino != st.st_ino or offset > st.st_size:
+        return None
+    if offset == st.st_size and st.st_mtime_ns > total_mtime_ns:
+        return None
+    return total, offset, tail[: min(offset, _tail_size)]
+
+
+def _write_total(
+    task_file: pathlib.Path, total: int, offset: int, ino: int, tail: bytes
+):
+    """Record that the first <offset> bytes of <task_file> (inode <ino>, ending in <tail>) sum to <total>."""
+    fd = os.open(task_file.with_suffix(".total"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        os.pwrite(fd, _total_format.pack(total, offset, ino, tail), 0)
+    finally:
+        os.close(fd)
+
+
+def _bump_total(
+    task_file: pathlib.Path, ino: int, start: int, end: int, count: int, tail: bytes
+):
+    """Add a row spanning bytes [start, end) of <task_file> (inode <ino>, ending in <tail>) to its running total.
+
+    The total is only advanced if it covered exactly the bytes before this row.
+    If it covers less (a concurrent append), it is left as is and Task.load sums the rows past it; if it covers more, or another file, the CSV changed underneath it and it is reset so that Task.load rescans the whole CSV.
+    """
+    try:
+        fd = os.open(task_file.with_suffix(".total"), os.O_RDWR)
+    except FileNotFoundError:
+        return
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        buf = os.pread(fd, _total_format.size, 0)
+        if len(buf) == _total_format.size:
+            total, offset, total_ino, _ = _total_format.unpack(buf)
+            if total_ino == ino and offset == start:
+                os.pwrite(fd, _total_format.pack(total + count, end, ino, tail), 0)
+            elif total_ino != ino or offset > start:
+                # The total covers bytes past this row's start, so the CSV was shrunk
+                # (or replaced) underneath it. Rows appended later would otherwise line
+                # up with the stale offset, so make the next load rescan instead.
+                os.pwrite(fd, _total_format.pack(0, 0, 0, b""), 0)
+    finally:
+        os.close(fd)
+
+
+@_typecheck
+def batch(config: pathlib.Path = default_config_path, init_task: bool = False):
+    """
+    Adds many entries at once, reading one "task,count" line per entry from stdin.
+
+    Each task file is opened and written once, however many entries it gets.
+
+    Arguments:
+        config: Where the config file is stored.
+        init_task: Whether to initialize new files for tasks that don't exist yet.
+    """
+    cfg = Config.from_path(config)
+
+    counts_by_task: dict[str, list[int]] = {}
+    for lineno, line in enumerate(sys.stdin, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        task, _, count = line.rpartition(",")
+        task = task.strip()
         try:
-            # Open the state file in the requested mode
-            with open(filepath, mode) as state_fd:
-                yield state_fd
-        finally:
-            fcntl.flock(lock_fd.fileno(), fcntl.LOCK_UN)
-            lock_file.unlink()  # Delete the lock file
+            count = int(count)
+        except ValueError:
+            task = ""
+        if not task:
+            print(
+                f"Error: line {lineno}: expected 'task,count', got {line!r}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        counts_by_task.setdefault(task, []).append(count)
+
+    # Check every task before writing anything so a typo doesn't leave a partial batch.
+    if not init_task:
+        missing = [task for task in counts_by_task if not Task.exists(cfg, task)]
+        if missing:
+            for task in missing:
+                print(f"Error: Task '{task}' not found", file=sys.stderr)
+            print("Use --init-task to create them.", file=sys.stderr)
+            sys.exit(1)
+
+    for task, counts in counts_by_task.items():
+        Task.extend(cfg, task, counts)
+
+
+def fast_cli(argv: list[str]):
+    """Minimal argparse equivalent of the tyro CLI, which is much cheaper to import.
+
+    Arguments:
+        argv: command-line arguments, without the program name.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="Adds to the task file.")
+    add_parser.add_argument("count", type=int, help="Number of actions completed.")
+    add_parser.add_argument("task", help="Which task the user is making progress on.")
+    add_parser.add_argument(
+        "--config",
+        type=pathlib.Path,
+        default=default_config_path,
+        help="Where the config file is stored.",
+    )
+    add_parser.add_argument(
+        "--init-task",
+        action="store_true",
+        help="Whether to initialize a new file for a new task.",
+    )
+
+    progress_parser = subparsers.add_parser(
+        "progress", help="Displays progress towards 10K."
+    )
+    progress_parser.add_argument(
+        "task", help="Which task the user is making progress on."
+    )
+    progress_parser.add_argument(
+        "--config",
+        type=pathlib.Path,
+        default=default_config_path,
+        help="Where the config file is stored.",
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Adds many entries at once from stdin."
+    )
+    batch_parser.add_argument(
+        "--config",
+        type=pathlib.Path,
+        default=default_config_path,
+        help="Where the config file is stored.",
+    )
+    batch_parser.add_argument(
+        "--init-task",
+        action="store_true",
+        help="Whether to initialize new files for tasks that don't exist yet.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "add":
+        add(args.count, args.task, config=args.config, init_task=args.init_task)
+    elif args.command == "progress":
+        progress(args.task, config=args.config)
+    else:
+        batch(config=args.config, init_task=args.init_task)
 
 
 if __name__ == "__main__":
-    tyro.extras.subcommand_cli_from_dict({
-        "add": add,
-        "progress": progress,
-    })
+    argv = sys.argv[1:]
+    # `10k add <count> <task>` and `10k progress <task>` are by far the most common
+    # invocations, so dispatch them without building any CLI parser. Anything else
+    # (flags, --help, negative counts) goes through the full parser below.
+    if (
+        len(argv) == 3
+        and argv[0] == "add"
+        and argv[1].isdecimal()
+        and not argv[2].startswith("-")
+    ):
+        add(int(argv[1]), argv[2])
+    elif len(argv) == 2 and argv[0] == "progress" and not argv[1].startswith("-"):
+        progress(argv[1])
+    elif not os.environ.get("TENKAY_FAST"):
+        import tyro
+
+        tyro.extras.subcommand_cli_from_dict({
+            "add": add,
+            "progress": progress,
+            "batch": batch,
+        })
+    else:
+        # TENKAY_FAST: skip tyro as well as beartype.
+        fast_cli(argv)
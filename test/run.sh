@@ -8,9 +8,29 @@ echo y | ./main.py add 5 pushups --config test/config.toml
 ./main.py add 0 pushups --config test/config.toml --init-task  # Try to reinit existing task
 ./main.py progress pushups --config test/config.toml  # Should still show 15 total
 
+# Test batch entry across tasks
+printf 'pushups,5\nmeditation,10\npushups,1\n' | ./main.py batch --config test/config.toml
+./main.py progress pushups --config test/config.toml  # Should show 21 total
+printf 'pushups,1\nsquats,1\n' | ./main.py batch --config test/config.toml  # Should fail, squats doesn't exist
+
+# Test that the cached total notices a row deleted by hand, even after later appends
+./main.py add 10 situps --config test/config.toml --init-task
+./main.py add 99 situps --config test/config.toml
+./main.py add 10 situps --config test/config.toml
+sed -i.bak '/,99$/d' test-state/2024/situps.csv && rm test-state/2024/situps.csv.bak
+./main.py add 11 situps --config test/config.toml
+./main.py add 12 situps --config test/config.toml
+./main.py progress situps --config test/config.toml  # Should show 43 total
+
+# Test that progress still works when the taskstore is read-only
+rm test-state/2024/situps.total
+chmod a-w test-state/2024
+./main.py progress situps --config test/config.toml  # Should show 43 total
+chmod u+w test-state/2024
+
 # Other tests
 ./main.py progress meditation --config test/config.toml
 ./main.py progress nonexistent --config test/config.toml
 echo n | ./main.py add 5 squats --config test/config.toml
 
-rm -rf test-state
+rm -rf test-state test/config.toml.cache